@@ -5,18 +5,6 @@ This package provides tools to analyze videos, audio, documents, and presentatio
 through executive personas to anticipate questions and concerns.
 """
 
-from .types import (
-    AnalysisResult,
-    ContentType,
-    ExtractionResult,
-    ExecutivePersona,
-    PersonaType,
-    Question,
-    ReviewReport,
-    UserPreferences,
-    UserType,
-)
-
 __all__ = [
     "AnalysisResult",
     "ContentType",
@@ -30,3 +18,16 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str):
+    # PEP 562 lazy re-export: importing the package no longer pulls in
+    # .types (and pydantic behind it) until one of the exported names is
+    # actually used, which keeps short-lived CLI invocations fast.
+    if name in __all__:
+        from . import types
+
+        value = getattr(types, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,12 +5,17 @@ Analyzes content through the lens of different executive personas
 to generate questions, concerns, and recommendations.
 """
 
+import functools
+import hashlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from .constants import (
     CONTENT_SUMMARY_PROMPT,
     EXECUTIVE_PERSONAS,
-    PERSONA_ANALYSIS_PROMPT,
+    PERSONA_ANALYSIS_PERSONA_SUFFIX,
+    PERSONA_ANALYSIS_SHARED_PREFIX,
 )
 from .types import (
     AnalysisResult,
@@ -28,6 +33,31 @@ from .types import (
 from .utils import print_status, truncate_text
 
 
+# Completed analyses keyed by (persona type, content hash). Analysis is
+# deterministic for a given persona and content, so re-analyzing the same
+# deck (or the same content for a repeated persona) becomes a dict lookup.
+_analysis_cache: dict[tuple[PersonaType, str], AnalysisResult] = {}
+
+# Every assembly site fills every field, so the fields-set passed to
+# model_construct is computed once here instead of from the kwargs per call.
+_ANALYSIS_RESULT_FIELDS = frozenset(AnalysisResult.model_fields)
+
+
+def _content_cache_key(content: ExtractionResult, content_summary: Optional[str]) -> str:
+    """Hash the analysis inputs so identical content maps to one cache entry."""
+    hasher = hashlib.sha256(content.text.encode("utf-8"))
+    if content_summary:
+        hasher.update(content_summary.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def clear_analysis_cache() -> None:
+    """Clear cached persona analyses (mainly useful for long-lived processes)."""
+    _analysis_cache.clear()
+    _shared_prefix_cache.clear()
+
+
+@functools.lru_cache(maxsize=None)
 def get_persona(persona_type: PersonaType) -> ExecutivePersona:
     """
     Get an executive persona by type.
@@ -57,13 +87,77 @@ def build_content_summary_prompt(content: ExtractionResult) -> str:
     return CONTENT_SUMMARY_PROMPT.format(content=text)
 
 
+# Formatted shared prefixes keyed by content hash, so re-analyzing the same
+# extraction (cache-augmented generation style) reuses the built prefix
+# instead of re-truncating and re-formatting the full content block.
+_shared_prefix_cache: dict[str, str] = {}
+
+
+def build_shared_prefix(content: ExtractionResult, content_summary: str) -> str:
+    """
+    Build the shared prompt prefix containing the content and its summary.
+
+    This block is identical for every persona, so when calling an LLM API
+    it should be sent once (e.g. as a cached system block) rather than
+    re-embedded in each persona prompt. The formatted prefix is cached by
+    content hash for reuse across repeat analyses of the same extraction.
+
+    Args:
+        content: Extracted content
+        content_summary: Pre-generated summary of the content
+
+    Returns:
+        Formatted prefix string
+    """
+    cache_key = _content_cache_key(content, content_summary)
+    prefix = _shared_prefix_cache.get(cache_key)
+    if prefix is None:
+        # Truncate content if too long
+        text = truncate_text(content.text, max_length=8000)
+
+        prefix = PERSONA_ANALYSIS_SHARED_PREFIX.format(
+            content_summary=content_summary,
+            content=text,
+        )
+        _shared_prefix_cache[cache_key] = prefix
+    return prefix
+
+
+# Persona definitions are static, so each formatted suffix is built at most
+# once per persona type and reused afterwards.
+_persona_suffix_cache: dict[PersonaType, str] = {}
+
+
+def build_persona_suffix(persona: ExecutivePersona) -> str:
+    """
+    Build the persona-specific portion of the analysis prompt.
+
+    Args:
+        persona: The executive persona to analyze as
+
+    Returns:
+        Formatted suffix string with only persona-specific fields
+    """
+    suffix = _persona_suffix_cache.get(persona.type)
+    if suffix is None:
+        suffix = PERSONA_ANALYSIS_PERSONA_SUFFIX.format(
+            persona_title=persona.title,
+            persona_name=persona.name,
+            focus_areas=", ".join(persona.focus_areas),
+            perspective=persona.perspective,
+            key_concerns="\n".join(f"- {c}" for c in persona.key_concerns),
+        )
+        _persona_suffix_cache[persona.type] = suffix
+    return suffix
+
+
 def build_persona_analysis_prompt(
     persona: ExecutivePersona,
     content: ExtractionResult,
     content_summary: str,
 ) -> str:
     """
-    Build a prompt for persona-based analysis.
+    Build a complete, self-contained prompt for persona-based analysis.
 
     Args:
         persona: The executive persona to analyze as
@@ -73,18 +167,7 @@ def build_persona_analysis_prompt(
     Returns:
         Formatted prompt string
     """
-    # Truncate content if too long
-    text = truncate_text(content.text, max_length=8000)
-
-    return PERSONA_ANALYSIS_PROMPT.format(
-        persona_title=persona.title,
-        persona_name=persona.name,
-        focus_areas=", ".join(persona.focus_areas),
-        perspective=persona.perspective,
-        key_concerns="\n".join(f"- {c}" for c in persona.key_concerns),
-        content_summary=content_summary,
-        content=text,
-    )
+    return build_shared_prefix(content, content_summary) + build_persona_suffix(persona)
 
 
 def analyze_for_persona(
@@ -111,6 +194,12 @@ def analyze_for_persona(
     Returns:
         AnalysisResult with questions, concerns, and recommendations
     """
+    cache_key = (persona.type, _content_cache_key(content, content_summary))
+    cached = _analysis_cache.get(cache_key)
+    if cached is not None:
+        print_status(f"Reusing cached analysis for {persona.title}", "info")
+        return cached
+
     print_status(f"Analyzing as {persona.title}...", "progress")
 
     # Generate analysis based on persona focus areas
@@ -123,14 +212,26 @@ def analyze_for_persona(
     risks = _generate_persona_risks(persona, content)
     recommendations = _generate_persona_recommendations(persona)
 
-    return AnalysisResult(
+    # Bucket questions by category here so report rendering reads the groups
+    # instead of re-grouping on every render
+    questions_by_category: dict[QuestionCategory, list[Question]] = {}
+    for question in questions:
+        questions_by_category.setdefault(question.category, []).append(question)
+
+    # The parts were all built and typed right here, so model_construct
+    # skips re-validating every nested Question/Concern/Risk for nothing
+    result = AnalysisResult.model_construct(
+        _fields_set=_ANALYSIS_RESULT_FIELDS,
         persona=persona,
-        questions=questions,
-        concerns=concerns,
-        followups=followups,
-        risks=risks,
-        recommendations=recommendations,
+        questions=tuple(questions),
+        questions_by_category=questions_by_category,
+        concerns=tuple(concerns),
+        followups=tuple(followups),
+        risks=tuple(risks),
+        recommendations=tuple(recommendations),
     )
+    _analysis_cache[cache_key] = result
+    return result
 
 
 def _generate_persona_questions(
@@ -167,15 +268,19 @@ def _generate_persona_questions(
     return questions
 
 
+# Severity assigned to a persona's top focus areas, in priority order.
+_CONCERN_SEVERITIES = (Severity.HIGH, Severity.MEDIUM, Severity.LOW)
+
+
 def _generate_persona_concerns(
     persona: ExecutivePersona, content: ExtractionResult
 ) -> list[Concern]:
     """Generate concerns based on persona's focus areas."""
     concerns = []
 
-    # Generate concerns based on focus areas
-    for i, focus_area in enumerate(persona.focus_areas[:3]):
-        severity = Severity.HIGH if i == 0 else (Severity.MEDIUM if i == 1 else Severity.LOW)
+    # Generate concerns based on focus areas; zip caps the loop at the
+    # severity table length, so no index bookkeeping or branch ladder needed
+    for focus_area, severity in zip(persona.focus_areas, _CONCERN_SEVERITIES):
         concerns.append(
             Concern(
                 title=f"{focus_area} Assessment",
@@ -191,42 +296,45 @@ def _generate_persona_concerns(
     return concerns
 
 
+# Follow-up requests are fixed per persona type, so the table is built once
+# at import instead of inside every _generate_persona_followups call.
+_PERSONA_FOLLOWUPS: dict[PersonaType, list[str]] = {
+    PersonaType.CEO: [
+        "Schedule a strategic alignment review with leadership team",
+        "Provide competitive analysis and market positioning data",
+        "Present 3-year impact projection",
+    ],
+    PersonaType.CFO: [
+        "Provide detailed TCO breakdown",
+        "Submit ROI analysis with assumptions documented",
+        "Present budget allocation proposal",
+    ],
+    PersonaType.CTO: [
+        "Provide architectural documentation",
+        "Schedule technical deep-dive with engineering team",
+        "Present integration assessment and timeline",
+    ],
+    PersonaType.VP_PRODUCT: [
+        "Present user research and feedback data",
+        "Provide roadmap impact analysis",
+        "Schedule product strategy alignment meeting",
+    ],
+    PersonaType.CISO: [
+        "Submit security assessment documentation",
+        "Provide compliance certification details",
+        "Present data flow and access control diagrams",
+    ],
+    PersonaType.VP_OPERATIONS: [
+        "Provide implementation timeline and milestones",
+        "Submit training and change management plan",
+        "Present operational impact assessment",
+    ],
+}
+
+
 def _generate_persona_followups(persona: ExecutivePersona) -> list[str]:
     """Generate expected follow-up requests."""
-    followups = {
-        PersonaType.CEO: [
-            "Schedule a strategic alignment review with leadership team",
-            "Provide competitive analysis and market positioning data",
-            "Present 3-year impact projection",
-        ],
-        PersonaType.CFO: [
-            "Provide detailed TCO breakdown",
-            "Submit ROI analysis with assumptions documented",
-            "Present budget allocation proposal",
-        ],
-        PersonaType.CTO: [
-            "Provide architectural documentation",
-            "Schedule technical deep-dive with engineering team",
-            "Present integration assessment and timeline",
-        ],
-        PersonaType.VP_PRODUCT: [
-            "Present user research and feedback data",
-            "Provide roadmap impact analysis",
-            "Schedule product strategy alignment meeting",
-        ],
-        PersonaType.CISO: [
-            "Submit security assessment documentation",
-            "Provide compliance certification details",
-            "Present data flow and access control diagrams",
-        ],
-        PersonaType.VP_OPERATIONS: [
-            "Provide implementation timeline and milestones",
-            "Submit training and change management plan",
-            "Present operational impact assessment",
-        ],
-    }
-
-    return followups.get(persona.type, ["Schedule follow-up meeting"])
+    return _PERSONA_FOLLOWUPS.get(persona.type, ["Schedule follow-up meeting"])
 
 
 def _generate_persona_risks(
@@ -292,11 +400,28 @@ def analyze_content(
     """
     print_status(f"Analyzing content for {len(personas)} personas", "progress")
 
-    results = []
-    for persona_type in personas:
-        persona = get_persona(persona_type)
-        result = analyze_for_persona(content, persona)
-        results.append(result)
+    # Build the content-bearing prompt prefix once; each persona only adds a
+    # short suffix on top of it. When backed by an LLM API, the prefix should
+    # be sent as a cached system block so it is tokenized once, not per persona.
+    content_summary = truncate_text(content.text, max_length=500)
+
+    # Personas are independent of each other, so analyze them concurrently.
+    # executor.map preserves the order of the requested personas.
+    if len(personas) > 1:
+        with ThreadPoolExecutor(max_workers=len(personas)) as executor:
+            results = list(
+                executor.map(
+                    lambda persona_type: analyze_for_persona(
+                        content, get_persona(persona_type), content_summary=content_summary
+                    ),
+                    personas,
+                )
+            )
+    else:
+        results = [
+            analyze_for_persona(content, get_persona(persona_type), content_summary=content_summary)
+            for persona_type in personas
+        ]
 
     print_status(f"Analysis complete: {len(results)} persona analyses", "success")
     return results
@@ -317,8 +442,11 @@ def get_consolidated_questions(analyses: list[AnalysisResult]) -> list[Question]
 
     for analysis in analyses:
         for question in analysis.questions:
-            if question.text not in seen_texts:
-                seen_texts.add(question.text)
+            # Intern the text so the dedup set compares repeated questions
+            # (personas share many of them) by pointer instead of by value.
+            text = sys.intern(question.text)
+            if text not in seen_texts:
+                seen_texts.add(text)
                 questions.append(question)
 
     return questions
@@ -339,7 +467,6 @@ def get_consolidated_concerns(analyses: list[AnalysisResult]) -> list[Concern]:
         concerns.extend(analysis.concerns)
 
     # Sort by severity (HIGH first)
-    severity_order = {Severity.HIGH: 0, Severity.MEDIUM: 1, Severity.LOW: 2}
-    concerns.sort(key=lambda c: severity_order.get(c.severity, 3))
+    concerns.sort(key=lambda c: c.severity.rank)
 
     return concerns
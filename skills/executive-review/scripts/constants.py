@@ -4,213 +4,240 @@ Constants for the Executive Review skill.
 Contains persona definitions, supported file types, and prompt templates.
 """
 
-from .types import ExecutivePersona, PersonaType, UserType
+from .types import ContentType, ExecutivePersona, PersonaType, UserType
 
 # ============================================================================
 # Supported File Extensions
 # ============================================================================
 
-SUPPORTED_VIDEO_EXTENSIONS: set[str] = {".mp4", ".webm", ".mov", ".avi", ".mkv"}
+SUPPORTED_VIDEO_EXTENSIONS: frozenset[str] = frozenset({".mp4", ".webm", ".mov", ".avi", ".mkv"})
 
-SUPPORTED_AUDIO_EXTENSIONS: set[str] = {".mp3", ".wav", ".m4a", ".flac", ".ogg"}
+SUPPORTED_AUDIO_EXTENSIONS: frozenset[str] = frozenset({".mp3", ".wav", ".m4a", ".flac", ".ogg"})
 
-SUPPORTED_DOCUMENT_EXTENSIONS: set[str] = {".pdf", ".docx", ".md", ".txt"}
+SUPPORTED_DOCUMENT_EXTENSIONS: frozenset[str] = frozenset({".pdf", ".docx", ".md", ".txt"})
 
-SUPPORTED_PRESENTATION_EXTENSIONS: set[str] = {".pptx"}
+SUPPORTED_PRESENTATION_EXTENSIONS: frozenset[str] = frozenset({".pptx"})
 
-ALL_SUPPORTED_EXTENSIONS: set[str] = (
+ALL_SUPPORTED_EXTENSIONS: frozenset[str] = (
     SUPPORTED_VIDEO_EXTENSIONS
     | SUPPORTED_AUDIO_EXTENSIONS
     | SUPPORTED_DOCUMENT_EXTENSIONS
     | SUPPORTED_PRESENTATION_EXTENSIONS
 )
 
+# Flat extension-to-content-type mapping so detection is one dict lookup
+# instead of four set membership tests.
+EXTENSION_CONTENT_TYPES: dict[str, ContentType] = {
+    **dict.fromkeys(SUPPORTED_VIDEO_EXTENSIONS, ContentType.VIDEO),
+    **dict.fromkeys(SUPPORTED_AUDIO_EXTENSIONS, ContentType.AUDIO),
+    **dict.fromkeys(SUPPORTED_DOCUMENT_EXTENSIONS, ContentType.DOCUMENT),
+    **dict.fromkeys(SUPPORTED_PRESENTATION_EXTENSIONS, ContentType.PRESENTATION),
+}
+
 # ============================================================================
 # Executive Personas
 # ============================================================================
 
-EXECUTIVE_PERSONAS: dict[PersonaType, ExecutivePersona] = {
-    PersonaType.CEO: ExecutivePersona(
-        type=PersonaType.CEO,
-        name="Chief Executive Officer",
-        title="CEO",
-        focus_areas=[
-            "Strategic vision",
-            "Market positioning",
-            "Competitive advantage",
-            "Company alignment",
-            "Long-term value",
-            "Stakeholder impact",
-        ],
-        question_style=(
-            "Asks big-picture questions that connect initiatives to company strategy. "
-            "Focuses on 'why' and 'what impact' rather than 'how'. Wants to understand "
-            "market differentiation and alignment with company mission."
-        ),
-        key_concerns=[
-            "Does this align with our 3-year roadmap?",
-            "What's the competitive advantage?",
-            "How does this affect our market position?",
-            "What's the impact on our stakeholders?",
-            "Is this the best use of our resources?",
-        ],
-        perspective=(
-            "Views everything through the lens of strategic value and company-wide impact. "
-            "Concerned with how initiatives fit into the broader vision and whether they "
-            "position the company for long-term success."
-        ),
-    ),
-    PersonaType.CFO: ExecutivePersona(
-        type=PersonaType.CFO,
-        name="Chief Financial Officer",
-        title="CFO",
-        focus_areas=[
-            "Total cost of ownership",
-            "Return on investment",
-            "Budget allocation",
-            "Financial risk",
-            "Payback period",
-            "Resource efficiency",
-        ],
-        question_style=(
-            "Asks precise questions about numbers, costs, and financial justification. "
-            "Wants clear ROI calculations, TCO analysis, and understanding of financial risks. "
-            "Skeptical of vague value propositions."
-        ),
-        key_concerns=[
-            "What's the total cost of ownership?",
-            "What's the expected ROI and payback period?",
-            "How does this fit into our budget?",
-            "What are the hidden costs?",
-            "What's the financial risk if this fails?",
-        ],
-        perspective=(
-            "Views everything through financial metrics and business value. Needs clear "
-            "quantification of benefits and costs. Focused on ensuring responsible "
-            "allocation of company resources."
-        ),
-    ),
-    PersonaType.CTO: ExecutivePersona(
-        type=PersonaType.CTO,
-        name="Chief Technology Officer",
-        title="CTO",
-        focus_areas=[
-            "Technical architecture",
-            "Scalability",
-            "Integration complexity",
-            "Technical debt",
-            "Security architecture",
-            "Technology standards",
-        ],
-        question_style=(
-            "Asks deep technical questions about architecture, scalability, and integration. "
-            "Wants to understand how solutions fit into the existing tech stack and what "
-            "technical risks or debt they might introduce."
-        ),
-        key_concerns=[
-            "How does this integrate with our existing stack?",
-            "What's the architectural impact?",
-            "How does this scale?",
-            "What technical debt does this create?",
-            "What are the performance implications?",
-        ],
-        perspective=(
-            "Views everything through technical feasibility and architectural soundness. "
-            "Concerned with maintainability, scalability, and how solutions fit into the "
-            "broader technology strategy."
-        ),
-    ),
-    PersonaType.VP_PRODUCT: ExecutivePersona(
-        type=PersonaType.VP_PRODUCT,
-        name="VP of Product",
-        title="VP of Product",
-        focus_areas=[
-            "User value",
-            "Product-market fit",
-            "Feature prioritization",
-            "Roadmap impact",
-            "Customer needs",
-            "Competitive features",
-        ],
-        question_style=(
-            "Asks questions focused on user value and product strategy. Wants to understand "
-            "how features solve real customer problems and how they fit into the product "
-            "roadmap and competitive landscape."
+# The six persona models are pydantic-validated on construction, which is
+# real CPU work to pay at import time for commands that never analyze
+# anything. They are built on first EXECUTIVE_PERSONAS access instead,
+# via the module __getattr__ below; validation still runs, but at most
+# once per process and only when a caller actually needs the personas.
+def _build_executive_personas() -> dict[PersonaType, ExecutivePersona]:
+    return {
+        PersonaType.CEO: ExecutivePersona(
+            type=PersonaType.CEO,
+            name="Chief Executive Officer",
+            title="CEO",
+            focus_areas=[
+                "Strategic vision",
+                "Market positioning",
+                "Competitive advantage",
+                "Company alignment",
+                "Long-term value",
+                "Stakeholder impact",
+            ],
+            question_style=(
+                "Asks big-picture questions that connect initiatives to company strategy. "
+                "Focuses on 'why' and 'what impact' rather than 'how'. Wants to understand "
+                "market differentiation and alignment with company mission."
+            ),
+            key_concerns=[
+                "Does this align with our 3-year roadmap?",
+                "What's the competitive advantage?",
+                "How does this affect our market position?",
+                "What's the impact on our stakeholders?",
+                "Is this the best use of our resources?",
+            ],
+            perspective=(
+                "Views everything through the lens of strategic value and company-wide impact. "
+                "Concerned with how initiatives fit into the broader vision and whether they "
+                "position the company for long-term success."
+            ),
         ),
-        key_concerns=[
-            "What problem does this solve for users?",
-            "How does this affect our product roadmap?",
-            "What's the user adoption risk?",
-            "How does this compare to competitor solutions?",
-            "What's the MVP vs full vision?",
-        ],
-        perspective=(
-            "Views everything through the lens of user value and product strategy. "
-            "Focused on ensuring solutions address real customer needs and contribute "
-            "to a coherent product vision."
+        PersonaType.CFO: ExecutivePersona(
+            type=PersonaType.CFO,
+            name="Chief Financial Officer",
+            title="CFO",
+            focus_areas=[
+                "Total cost of ownership",
+                "Return on investment",
+                "Budget allocation",
+                "Financial risk",
+                "Payback period",
+                "Resource efficiency",
+            ],
+            question_style=(
+                "Asks precise questions about numbers, costs, and financial justification. "
+                "Wants clear ROI calculations, TCO analysis, and understanding of financial risks. "
+                "Skeptical of vague value propositions."
+            ),
+            key_concerns=[
+                "What's the total cost of ownership?",
+                "What's the expected ROI and payback period?",
+                "How does this fit into our budget?",
+                "What are the hidden costs?",
+                "What's the financial risk if this fails?",
+            ],
+            perspective=(
+                "Views everything through financial metrics and business value. Needs clear "
+                "quantification of benefits and costs. Focused on ensuring responsible "
+                "allocation of company resources."
+            ),
         ),
-    ),
-    PersonaType.CISO: ExecutivePersona(
-        type=PersonaType.CISO,
-        name="Chief Information Security Officer",
-        title="CISO",
-        focus_areas=[
-            "Security posture",
-            "Compliance requirements",
-            "Data privacy",
-            "Attack surface",
-            "Risk assessment",
-            "Incident response",
-        ],
-        question_style=(
-            "Asks probing questions about security implications and compliance. Wants to "
-            "understand data flows, access controls, and potential vulnerabilities. "
-            "Skeptical until security is proven."
+        PersonaType.CTO: ExecutivePersona(
+            type=PersonaType.CTO,
+            name="Chief Technology Officer",
+            title="CTO",
+            focus_areas=[
+                "Technical architecture",
+                "Scalability",
+                "Integration complexity",
+                "Technical debt",
+                "Security architecture",
+                "Technology standards",
+            ],
+            question_style=(
+                "Asks deep technical questions about architecture, scalability, and integration. "
+                "Wants to understand how solutions fit into the existing tech stack and what "
+                "technical risks or debt they might introduce."
+            ),
+            key_concerns=[
+                "How does this integrate with our existing stack?",
+                "What's the architectural impact?",
+                "How does this scale?",
+                "What technical debt does this create?",
+                "What are the performance implications?",
+            ],
+            perspective=(
+                "Views everything through technical feasibility and architectural soundness. "
+                "Concerned with maintainability, scalability, and how solutions fit into the "
+                "broader technology strategy."
+            ),
         ),
-        key_concerns=[
-            "What's the attack surface?",
-            "Is this SOC2/GDPR/HIPAA compliant?",
-            "How is data protected at rest and in transit?",
-            "What access controls are in place?",
-            "What's the incident response plan?",
-        ],
-        perspective=(
-            "Views everything through security and compliance lens. Assumes breach "
-            "scenarios and evaluates defensive posture. Focused on protecting company "
-            "and customer data."
+        PersonaType.VP_PRODUCT: ExecutivePersona(
+            type=PersonaType.VP_PRODUCT,
+            name="VP of Product",
+            title="VP of Product",
+            focus_areas=[
+                "User value",
+                "Product-market fit",
+                "Feature prioritization",
+                "Roadmap impact",
+                "Customer needs",
+                "Competitive features",
+            ],
+            question_style=(
+                "Asks questions focused on user value and product strategy. Wants to understand "
+                "how features solve real customer problems and how they fit into the product "
+                "roadmap and competitive landscape."
+            ),
+            key_concerns=[
+                "What problem does this solve for users?",
+                "How does this affect our product roadmap?",
+                "What's the user adoption risk?",
+                "How does this compare to competitor solutions?",
+                "What's the MVP vs full vision?",
+            ],
+            perspective=(
+                "Views everything through the lens of user value and product strategy. "
+                "Focused on ensuring solutions address real customer needs and contribute "
+                "to a coherent product vision."
+            ),
         ),
-    ),
-    PersonaType.VP_OPERATIONS: ExecutivePersona(
-        type=PersonaType.VP_OPERATIONS,
-        name="VP of Operations",
-        title="VP of Operations",
-        focus_areas=[
-            "Implementation complexity",
-            "Rollout planning",
-            "Training requirements",
-            "Change management",
-            "Operational efficiency",
-            "Support burden",
-        ],
-        question_style=(
-            "Asks practical questions about implementation and ongoing operations. Wants "
-            "to understand the rollout plan, training needs, and impact on existing "
-            "workflows and support teams."
+        PersonaType.CISO: ExecutivePersona(
+            type=PersonaType.CISO,
+            name="Chief Information Security Officer",
+            title="CISO",
+            focus_areas=[
+                "Security posture",
+                "Compliance requirements",
+                "Data privacy",
+                "Attack surface",
+                "Risk assessment",
+                "Incident response",
+            ],
+            question_style=(
+                "Asks probing questions about security implications and compliance. Wants to "
+                "understand data flows, access controls, and potential vulnerabilities. "
+                "Skeptical until security is proven."
+            ),
+            key_concerns=[
+                "What's the attack surface?",
+                "Is this SOC2/GDPR/HIPAA compliant?",
+                "How is data protected at rest and in transit?",
+                "What access controls are in place?",
+                "What's the incident response plan?",
+            ],
+            perspective=(
+                "Views everything through security and compliance lens. Assumes breach "
+                "scenarios and evaluates defensive posture. Focused on protecting company "
+                "and customer data."
+            ),
         ),
-        key_concerns=[
-            "What's the rollout plan?",
-            "What training is required?",
-            "How does this affect existing workflows?",
-            "What's the support burden?",
-            "What's the change management strategy?",
-        ],
-        perspective=(
-            "Views everything through operational feasibility. Concerned with practical "
-            "implementation, team readiness, and sustainable operations. Focused on "
-            "ensuring smooth adoption and minimal disruption."
+        PersonaType.VP_OPERATIONS: ExecutivePersona(
+            type=PersonaType.VP_OPERATIONS,
+            name="VP of Operations",
+            title="VP of Operations",
+            focus_areas=[
+                "Implementation complexity",
+                "Rollout planning",
+                "Training requirements",
+                "Change management",
+                "Operational efficiency",
+                "Support burden",
+            ],
+            question_style=(
+                "Asks practical questions about implementation and ongoing operations. Wants "
+                "to understand the rollout plan, training needs, and impact on existing "
+                "workflows and support teams."
+            ),
+            key_concerns=[
+                "What's the rollout plan?",
+                "What training is required?",
+                "How does this affect existing workflows?",
+                "What's the support burden?",
+                "What's the change management strategy?",
+            ],
+            perspective=(
+                "Views everything through operational feasibility. Concerned with practical "
+                "implementation, team readiness, and sustainable operations. Focused on "
+                "ensuring smooth adoption and minimal disruption."
+            ),
         ),
-    ),
-}
+    }
+
+
+_executive_personas: dict[PersonaType, ExecutivePersona] | None = None
+
+
+def __getattr__(name: str):
+    if name == "EXECUTIVE_PERSONAS":
+        global _executive_personas
+        if _executive_personas is None:
+            _executive_personas = _build_executive_personas()
+        return _executive_personas
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ============================================================================
 # User Type to Persona Recommendations
@@ -243,21 +270,30 @@ Content:
 Provide a 2-3 paragraph summary suitable for executive review.
 """
 
-PERSONA_ANALYSIS_PROMPT = """
-You are acting as a {persona_title} ({persona_name}) reviewing the following content.
+# The persona analysis prompt is split into a shared prefix (the large content
+# block, identical for every persona) and a per-persona suffix. Keeping the
+# content first lets an LLM backend cache the shared prefix once (e.g. via
+# Anthropic prompt caching) and pay only for the short suffix per persona.
 
-Your focus areas are: {focus_areas}
-
-Your perspective: {perspective}
-
-Your typical concerns include:
-{key_concerns}
+PERSONA_ANALYSIS_SHARED_PREFIX = """
+You are reviewing the following content on behalf of an executive audience.
 
 Content Summary:
 {content_summary}
 
 Full Content:
 {content}
+"""
+
+PERSONA_ANALYSIS_PERSONA_SUFFIX = """
+For this review, act as a {persona_title} ({persona_name}).
+
+Your focus areas are: {focus_areas}
+
+Your perspective: {perspective}
+
+Your typical concerns include:
+{key_concerns}
 
 Based on this content, provide:
 
@@ -290,6 +326,9 @@ Based on this content, provide:
 Format your response as structured JSON matching the AnalysisResult schema.
 """
 
+# Combined template for callers that want a single self-contained prompt.
+PERSONA_ANALYSIS_PROMPT = PERSONA_ANALYSIS_SHARED_PREFIX + PERSONA_ANALYSIS_PERSONA_SUFFIX
+
 CHECKLIST_GENERATION_PROMPT = """
 Based on the following executive persona analyses, create a consolidated preparation checklist.
 
@@ -327,4 +366,5 @@ MAX_FRAMES_TO_EXTRACT = 100  # Maximum number of frames to extract
 
 DEFAULT_OUTPUT_DIR = "output"
 REPORT_FILENAME_TEMPLATE = "executive-review-{timestamp}.md"
+EXTRACTION_CACHE_DIRNAME = ".extraction-cache"
 
@@ -4,11 +4,15 @@ Content type detection for the Executive Review skill.
 Detects file types and validates files for processing.
 """
 
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from .constants import (
     ALL_SUPPORTED_EXTENSIONS,
+    EXTENSION_CONTENT_TYPES,
     SUPPORTED_AUDIO_EXTENSIONS,
     SUPPORTED_DOCUMENT_EXTENSIONS,
     SUPPORTED_PRESENTATION_EXTENSIONS,
@@ -28,18 +32,7 @@ def detect_content_type(file_path: Path) -> Optional[ContentType]:
     Returns:
         ContentType if recognized, None otherwise
     """
-    ext = get_file_extension(file_path)
-
-    if ext in SUPPORTED_VIDEO_EXTENSIONS:
-        return ContentType.VIDEO
-    elif ext in SUPPORTED_AUDIO_EXTENSIONS:
-        return ContentType.AUDIO
-    elif ext in SUPPORTED_DOCUMENT_EXTENSIONS:
-        return ContentType.DOCUMENT
-    elif ext in SUPPORTED_PRESENTATION_EXTENSIONS:
-        return ContentType.PRESENTATION
-
-    return None
+    return EXTENSION_CONTENT_TYPES.get(get_file_extension(file_path))
 
 
 def validate_file(file_path: Path) -> tuple[bool, str]:
@@ -52,22 +45,22 @@ def validate_file(file_path: Path) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, message)
     """
-    # Check if path exists
-    if not file_path.exists():
+    # One stat covers existence, file-vs-directory, and size; exists()/
+    # is_file()/stat() each issue their own syscall otherwise.
+    try:
+        file_stat = file_path.stat()
+    except FileNotFoundError:
         return False, f"File not found: {file_path}"
+    except OSError as e:
+        return False, f"Cannot read file: {file_path} - {e}"
 
     # Check if it's a file (not a directory)
-    if not file_path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         return False, f"Path is not a file: {file_path}"
 
-    # Check if file is readable
-    try:
-        with open(file_path, "rb") as f:
-            f.read(1)  # Try to read first byte
-    except PermissionError:
+    # Check if file is readable without opening it
+    if not os.access(file_path, os.R_OK):
         return False, f"Permission denied: {file_path}"
-    except IOError as e:
-        return False, f"Cannot read file: {file_path} - {e}"
 
     # Check if extension is supported
     ext = get_file_extension(file_path)
@@ -76,7 +69,7 @@ def validate_file(file_path: Path) -> tuple[bool, str]:
         return False, f"Unsupported file type: {ext}. Supported types: {supported_list}"
 
     # Check if file is not empty
-    if file_path.stat().st_size == 0:
+    if file_stat.st_size == 0:
         return False, f"File is empty: {file_path}"
 
     return True, "File is valid"
@@ -117,6 +110,26 @@ def get_file_info(file_path: Path) -> dict:
     return info
 
 
+def get_file_info_batch(file_paths: list[Path]) -> list[dict]:
+    """
+    Get file information for a batch of files concurrently.
+
+    Validation is dominated by filesystem stats, so the per-file work is
+    fanned out over threads; results come back in input order.
+
+    Args:
+        file_paths: Paths to the files to inspect
+
+    Returns:
+        List of file information dictionaries, one per input path
+    """
+    if len(file_paths) <= 1:
+        return [get_file_info(p) for p in file_paths]
+
+    with ThreadPoolExecutor(max_workers=min(len(file_paths), 8)) as executor:
+        return list(executor.map(get_file_info, file_paths))
+
+
 def get_supported_extensions_by_type() -> dict[str, list[str]]:
     """
     Get a dictionary of supported extensions grouped by content type.
@@ -132,6 +145,20 @@ def get_supported_extensions_by_type() -> dict[str, list[str]]:
     }
 
 
+# Suggestions for common unsupported extensions, merged into one lookup table.
+_VIDEO_SUGGESTION = "video (unsupported format, consider converting to MP4)"
+_AUDIO_SUGGESTION = "audio (unsupported format, consider converting to MP3)"
+_DOCUMENT_SUGGESTION = "document (unsupported format, consider converting to PDF or DOCX)"
+_PRESENTATION_SUGGESTION = "presentation (unsupported format, consider converting to PPTX)"
+
+_EXTENSION_SUGGESTIONS: dict[str, str] = {
+    **dict.fromkeys({".wmv", ".flv", ".m4v", ".3gp", ".ts"}, _VIDEO_SUGGESTION),
+    **dict.fromkeys({".aac", ".wma", ".aiff"}, _AUDIO_SUGGESTION),
+    **dict.fromkeys({".doc", ".rtf", ".odt", ".pages"}, _DOCUMENT_SUGGESTION),
+    **dict.fromkeys({".ppt", ".odp", ".key"}, _PRESENTATION_SUGGESTION),
+}
+
+
 def suggest_content_type_for_extension(ext: str) -> Optional[str]:
     """
     Suggest a content type for an unsupported extension.
@@ -144,24 +171,4 @@ def suggest_content_type_for_extension(ext: str) -> Optional[str]:
     """
     ext = ext.lower() if ext.startswith(".") else f".{ext.lower()}"
 
-    # Common video formats not in our list
-    video_like = {".wmv", ".flv", ".m4v", ".3gp", ".ts"}
-    if ext in video_like:
-        return "video (unsupported format, consider converting to MP4)"
-
-    # Common audio formats not in our list
-    audio_like = {".aac", ".wma", ".aiff"}
-    if ext in audio_like:
-        return "audio (unsupported format, consider converting to MP3)"
-
-    # Common document formats not in our list
-    doc_like = {".doc", ".rtf", ".odt", ".pages"}
-    if ext in doc_like:
-        return "document (unsupported format, consider converting to PDF or DOCX)"
-
-    # Common presentation formats not in our list
-    pres_like = {".ppt", ".odp", ".key"}
-    if ext in pres_like:
-        return "presentation (unsupported format, consider converting to PPTX)"
-
-    return None
+    return _EXTENSION_SUGGESTIONS.get(ext)
@@ -7,11 +7,14 @@ Handles extraction of text, transcripts, and images from various file types:
 - Presentations: PPTX text, notes, and slide images
 """
 
+import hashlib
 import io
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from .constants import (
     DEFAULT_FRAME_INTERVAL_SECONDS,
@@ -40,6 +43,29 @@ from .utils import (
 # Whisper Transcription
 # ============================================================================
 
+# Loaded Whisper models by name. Loading pulls hundreds of MB of weights off
+# disk, so models are kept alive and reused across transcriptions.
+_whisper_models: dict[str, Any] = {}
+_whisper_models_lock = threading.Lock()
+
+
+def _load_whisper_model(model: str) -> Any:
+    """Load a Whisper model, reusing a previously loaded instance if present."""
+    whisper_model = _whisper_models.get(model)
+    if whisper_model is None:
+        # Serialize loading so concurrent batch workers don't each pull a
+        # multi-hundred-MB model (or race the same checkpoint download);
+        # re-check under the lock, then later callers hit the fast path
+        with _whisper_models_lock:
+            whisper_model = _whisper_models.get(model)
+            if whisper_model is None:
+                import whisper
+
+                print_status(f"Loading Whisper model: {model}", "progress")
+                whisper_model = whisper.load_model(model)
+                _whisper_models[model] = whisper_model
+    return whisper_model
+
 
 def extract_transcript(
     file_path: Path,
@@ -57,24 +83,21 @@ def extract_transcript(
     Returns:
         ExtractionResult with transcript text and segments
     """
-    import whisper
-
-    print_status(f"Loading Whisper model: {model}", "progress")
-    whisper_model = whisper.load_model(model)
+    whisper_model = _load_whisper_model(model)
 
     print_status(f"Transcribing: {file_path.name}", "progress")
     result = whisper_model.transcribe(str(file_path))
 
-    # Extract segments with timestamps
-    segments = []
-    for segment in result.get("segments", []):
-        segments.append(
-            TimestampedSegment(
-                start=segment["start"],
-                end=segment["end"],
-                text=segment["text"].strip(),
-            )
+    # Extract segments with timestamps in one comprehension pass; long
+    # recordings produce thousands of segments, so avoid per-item appends.
+    segments = [
+        TimestampedSegment(
+            start=segment["start"],
+            end=segment["end"],
+            text=segment["text"].strip(),
         )
+        for segment in result.get("segments", [])
+    ]
 
     # Get duration
     duration = get_video_duration(file_path) or get_audio_duration(file_path)
@@ -151,24 +174,29 @@ def extract_frames(
     frame_count = 0
     current_frame = 0
 
-    while True:
-        video.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
-        success, frame = video.read()
-
-        if not success or frame_count >= max_frames:
+    # Decode the stream sequentially and keep every frame_interval-th frame.
+    # grab() skips decoding for discarded frames, and a single forward pass
+    # avoids the expensive re-seek that CAP_PROP_POS_FRAMES does per capture.
+    while frame_count < max_frames:
+        if current_frame % frame_interval == 0:
+            success, frame = video.read()
+            if not success:
+                break
+
+            # Calculate timestamp
+            timestamp = current_frame / fps if fps > 0 else 0
+            timestamp_str = f"{int(timestamp // 60):02d}m{int(timestamp % 60):02d}s"
+
+            # Save frame
+            frame_path = frames_dir / f"frame_{frame_count:04d}_{timestamp_str}.jpg"
+            cv2.imwrite(str(frame_path), frame)
+            extracted_paths.append(frame_path)
+
+            frame_count += 1
+        elif not video.grab():
             break
 
-        # Calculate timestamp
-        timestamp = current_frame / fps if fps > 0 else 0
-        timestamp_str = f"{int(timestamp // 60):02d}m{int(timestamp % 60):02d}s"
-
-        # Save frame
-        frame_path = frames_dir / f"frame_{frame_count:04d}_{timestamp_str}.jpg"
-        cv2.imwrite(str(frame_path), frame)
-        extracted_paths.append(frame_path)
-
-        frame_count += 1
-        current_frame += frame_interval
+        current_frame += 1
 
     video.release()
 
@@ -197,6 +225,7 @@ def extract_pdf(file_path: Path, output_dir: Optional[Path] = None) -> Extractio
     print_status(f"Extracting PDF: {file_path.name}", "progress")
 
     doc = fitz.open(str(file_path))
+    page_count = doc.page_count
     text_parts = []
     image_paths = []
 
@@ -231,7 +260,7 @@ def extract_pdf(file_path: Path, output_dir: Optional[Path] = None) -> Extractio
         file_name=file_path.name,
         file_size_bytes=file_path.stat().st_size,
         content_type=ContentType.DOCUMENT,
-        page_count=len(list(fitz.open(str(file_path)))),
+        page_count=page_count,
     )
 
     print_status(f"Extracted {metadata.page_count} pages, {len(image_paths)} images", "success")
@@ -243,12 +272,13 @@ def extract_pdf(file_path: Path, output_dir: Optional[Path] = None) -> Extractio
     )
 
 
-def extract_docx(file_path: Path) -> ExtractionResult:
+def extract_docx(file_path: Path, output_dir: Optional[Path] = None) -> ExtractionResult:
     """
     Extract text from Word document.
 
     Args:
         file_path: Path to DOCX file
+        output_dir: Unused; accepted so all document extractors share a signature
 
     Returns:
         ExtractionResult with text content
@@ -275,12 +305,13 @@ def extract_docx(file_path: Path) -> ExtractionResult:
     )
 
 
-def extract_markdown(file_path: Path) -> ExtractionResult:
+def extract_markdown(file_path: Path, output_dir: Optional[Path] = None) -> ExtractionResult:
     """
     Extract text from Markdown file.
 
     Args:
         file_path: Path to MD file
+        output_dir: Unused; accepted so all document extractors share a signature
 
     Returns:
         ExtractionResult with text content
@@ -303,12 +334,13 @@ def extract_markdown(file_path: Path) -> ExtractionResult:
     )
 
 
-def extract_text_file(file_path: Path) -> ExtractionResult:
+def extract_text_file(file_path: Path, output_dir: Optional[Path] = None) -> ExtractionResult:
     """
     Extract text from plain text file.
 
     Args:
         file_path: Path to TXT file
+        output_dir: Unused; accepted so all document extractors share a signature
 
     Returns:
         ExtractionResult with text content
@@ -331,6 +363,16 @@ def extract_text_file(file_path: Path) -> ExtractionResult:
     )
 
 
+# Per-extension document extractors; all share the (file_path, output_dir)
+# signature so dispatch is a single dict lookup.
+_DOCUMENT_EXTRACTORS = {
+    ".pdf": extract_pdf,
+    ".docx": extract_docx,
+    ".md": extract_markdown,
+    ".txt": extract_text_file,
+}
+
+
 def extract_document(
     file_path: Path, output_dir: Optional[Path] = None
 ) -> ExtractionResult:
@@ -346,16 +388,10 @@ def extract_document(
     """
     ext = get_file_extension(file_path)
 
-    if ext == ".pdf":
-        return extract_pdf(file_path, output_dir)
-    elif ext == ".docx":
-        return extract_docx(file_path)
-    elif ext == ".md":
-        return extract_markdown(file_path)
-    elif ext == ".txt":
-        return extract_text_file(file_path)
-    else:
+    extractor = _DOCUMENT_EXTRACTORS.get(ext)
+    if extractor is None:
         raise ValueError(f"Unsupported document format: {ext}")
+    return extractor(file_path, output_dir)
 
 
 # ============================================================================
@@ -392,11 +428,12 @@ def extract_pptx(
         if slide.shapes.title:
             title = slide.shapes.title.text
 
-        # Extract all text from shapes
+        # Extract all text from shapes; read shape.text once per shape since
+        # python-pptx rebuilds the string from the XML on every access
         slide_text_parts = []
         for shape in slide.shapes:
-            if hasattr(shape, "text") and shape.text.strip():
-                slide_text_parts.append(shape.text)
+            if hasattr(shape, "text") and (shape_text := shape.text).strip():
+                slide_text_parts.append(shape_text)
 
         slide_text = "\n".join(slide_text_parts)
 
@@ -408,18 +445,21 @@ def extract_pptx(
             if notes_text_frame and notes_text_frame.text.strip():
                 notes = notes_text_frame.text.strip()
 
+        # Clean once and reuse for both the slide record and the flat text
+        cleaned_slide_text = clean_text(slide_text)
+
         # Create slide content
         slide_content = SlideContent(
             slide_number=slide_num,
             title=title,
-            text=clean_text(slide_text),
+            text=cleaned_slide_text,
             notes=notes,
         )
         slides_content.append(slide_content)
 
         # Build text representation
         text_parts.append(f"--- Slide {slide_num}: {title or 'Untitled'} ---")
-        text_parts.append(slide_text)
+        text_parts.append(cleaned_slide_text)
         if notes:
             text_parts.append(f"[Speaker Notes: {notes}]")
         text_parts.append("")
@@ -475,6 +515,30 @@ def extract_presentation(
 # ============================================================================
 
 
+def _extraction_cache_path(
+    file_path: Path,
+    cache_dir: Path,
+    enable_frames: bool,
+    whisper_model: str,
+    frame_interval: int,
+) -> Path:
+    """
+    Compute the cache file path for an extraction of file_path.
+
+    The key hashes the resolved path plus size and mtime rather than the file
+    bytes: it identifies the same unmodified file without re-reading what can
+    be gigabytes of video just to decide whether extraction can be skipped.
+    The extraction options are part of the key too, so a run with --frames or
+    a different whisper model never reuses a result produced without them.
+    """
+    file_stat = file_path.stat()
+    key = hashlib.sha256(
+        f"{file_path.resolve()}:{file_stat.st_size}:{file_stat.st_mtime_ns}"
+        f":{enable_frames}:{whisper_model}:{frame_interval}".encode("utf-8")
+    ).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
 def extract_content(
     file_path: Path,
     content_type: ContentType,
@@ -482,6 +546,7 @@ def extract_content(
     enable_frames: bool = False,
     whisper_model: str = WHISPER_DEFAULT_MODEL,
     frame_interval: int = DEFAULT_FRAME_INTERVAL_SECONDS,
+    cache_dir: Optional[Path] = None,
 ) -> ExtractionResult:
     """
     Main extraction dispatcher. Routes to appropriate extractor based on content type.
@@ -493,31 +558,101 @@ def extract_content(
         enable_frames: Whether to extract video frames (for video only)
         whisper_model: Whisper model to use for transcription
         frame_interval: Seconds between frame captures
+        cache_dir: If given, reuse a previously cached extraction of the same
+            unmodified file with the same extraction options from this
+            directory and cache new results there
 
     Returns:
         ExtractionResult with extracted content
     """
-    if content_type == ContentType.VIDEO:
-        # Transcribe video
-        result = extract_transcript(file_path, model=whisper_model, output_dir=output_dir)
-
-        # Optionally extract frames
-        if enable_frames and output_dir:
-            frame_paths = extract_frames(
-                file_path, output_dir, interval_seconds=frame_interval
-            )
-            result.image_paths = frame_paths
+    extractor = _CONTENT_EXTRACTORS.get(content_type)
+    if extractor is None:
+        raise ValueError(f"Unknown content type: {content_type}")
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _extraction_cache_path(
+            file_path, cache_dir, enable_frames, whisper_model, frame_interval
+        )
+        if cache_path.exists():
+            try:
+                result = ExtractionResult.model_validate_json(
+                    cache_path.read_text(encoding="utf-8")
+                )
+                print_status(f"Using cached extraction for: {file_path.name}", "info")
+                return result
+            except ValueError:
+                pass  # Corrupt or outdated cache entry; re-extract
+
+    result = extractor(file_path, output_dir, enable_frames, whisper_model, frame_interval)
+
+    if cache_path is not None:
+        ensure_directory(cache_path.parent)
+        cache_path.write_text(result.model_dump_json(), encoding="utf-8")
+
+    return result
 
+
+def _extract_video_content(
+    file_path: Path,
+    output_dir: Optional[Path],
+    enable_frames: bool,
+    whisper_model: str,
+    frame_interval: int,
+) -> ExtractionResult:
+    """Transcribe a video and optionally extract frames."""
+    # Frame extraction only reads the video, so it can run alongside the
+    # (much longer) transcription instead of after it
+    if enable_frames and output_dir:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            frames_future = executor.submit(
+                extract_frames, file_path, output_dir, frame_interval
+            )
+            result = extract_transcript(file_path, model=whisper_model, output_dir=output_dir)
+            result.image_paths = tuple(frames_future.result())
         return result
 
-    elif content_type == ContentType.AUDIO:
-        return extract_transcript(file_path, model=whisper_model, output_dir=output_dir)
+    return extract_transcript(file_path, model=whisper_model, output_dir=output_dir)
 
-    elif content_type == ContentType.DOCUMENT:
-        return extract_document(file_path, output_dir)
 
-    elif content_type == ContentType.PRESENTATION:
-        return extract_presentation(file_path, output_dir)
+def _extract_audio_content(
+    file_path: Path,
+    output_dir: Optional[Path],
+    enable_frames: bool,
+    whisper_model: str,
+    frame_interval: int,
+) -> ExtractionResult:
+    """Transcribe an audio file."""
+    return extract_transcript(file_path, model=whisper_model, output_dir=output_dir)
 
-    else:
-        raise ValueError(f"Unknown content type: {content_type}")
+
+def _extract_document_content(
+    file_path: Path,
+    output_dir: Optional[Path],
+    enable_frames: bool,
+    whisper_model: str,
+    frame_interval: int,
+) -> ExtractionResult:
+    """Extract a document file."""
+    return extract_document(file_path, output_dir)
+
+
+def _extract_presentation_content(
+    file_path: Path,
+    output_dir: Optional[Path],
+    enable_frames: bool,
+    whisper_model: str,
+    frame_interval: int,
+) -> ExtractionResult:
+    """Extract a presentation file."""
+    return extract_presentation(file_path, output_dir)
+
+
+# Content-type handlers sharing one signature so extract_content dispatches
+# with a single dict lookup.
+_CONTENT_EXTRACTORS = {
+    ContentType.VIDEO: _extract_video_content,
+    ContentType.AUDIO: _extract_audio_content,
+    ContentType.DOCUMENT: _extract_document_content,
+    ContentType.PRESENTATION: _extract_presentation_content,
+}
@@ -14,15 +14,30 @@ Examples:
     python scripts/extract_only.py proposal.pdf
 """
 
+import os.path
+import sys
+
+# Only bootstrap sys.path when invoked directly (python scripts/extract_only.py);
+# when imported as part of the package or run via the executive-review-extract
+# console script, the package is already importable and no path munging
+# happens. For direct invocation the script directory itself must also be
+# dropped from the path, because modules here (types.py) would otherwise
+# shadow the stdlib modules that argparse and friends import.
+if __package__ in (None, ""):
+    _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [
+        p for p in sys.path if os.path.abspath(p or os.getcwd()) != _SCRIPT_DIR
+    ]
+    sys.path.insert(0, os.path.dirname(_SCRIPT_DIR))
+
 import argparse
 import json
-import sys
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from scripts.constants import (
     DEFAULT_FRAME_INTERVAL_SECONDS,
     RAPID_DEMO_FRAME_INTERVAL_SECONDS,
@@ -47,16 +62,28 @@ def create_argument_parser() -> argparse.ArgumentParser:
     )
 
     parser.add_argument(
-        "file",
+        "files",
         type=Path,
-        help="Path to the file to extract content from",
+        nargs="+",
+        metavar="file",
+        help="Path(s) to the file(s) to extract content from",
     )
 
     parser.add_argument(
         "--output",
         "-o",
         type=Path,
-        help="Output JSON file path (default: stdout)",
+        help=(
+            "Output JSON file path (default: stdout); with multiple input "
+            "files, a directory that receives one <name>.json per file"
+        ),
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Concurrent extractions when multiple files are given (default: CPU count, capped at 4)",
     )
 
     parser.add_argument(
@@ -98,45 +125,40 @@ def create_argument_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main():
-    """Main entry point."""
-    parser = create_argument_parser()
-    args = parser.parse_args()
-
+def extract_one(file_path: Path, args, frame_interval: int):
+    """Run the extraction pipeline for one file; None on failure."""
     # Validate file
-    is_valid, message = validate_file(args.file)
+    is_valid, message = validate_file(file_path)
     if not is_valid:
         print_status(message, "error")
-        sys.exit(1)
+        return None
 
     # Detect content type
-    content_type = detect_content_type(args.file)
+    content_type = detect_content_type(file_path)
     if not content_type:
-        print_status(f"Could not detect content type for: {args.file}", "error")
-        sys.exit(1)
+        print_status(f"Could not detect content type for: {file_path}", "error")
+        return None
 
-    print_status(f"Extracting from: {args.file.name}", "progress")
+    print_status(f"Extracting from: {file_path.name}", "progress")
     print_status(f"Content type: {get_content_type_display(content_type)}", "info")
 
-    # Determine frame interval
-    if args.frame_interval is not None:
-        frame_interval = args.frame_interval
-    elif args.rapid:
-        frame_interval = RAPID_DEMO_FRAME_INTERVAL_SECONDS
-        print_status(f"Rapid demo mode: capturing frames every {frame_interval}s", "info")
-    else:
-        frame_interval = DEFAULT_FRAME_INTERVAL_SECONDS
-
     # Set up output directory for frames/images
     output_dir = args.output_dir
-    if args.frames and not output_dir:
-        output_dir = args.file.parent / f"{args.file.stem}_extracted"
+    if args.frames:
+        if not output_dir:
+            output_dir = file_path.parent / f"{file_path.stem}_extracted"
+        elif len(args.files) > 1:
+            # A shared --output-dir in batch mode would have every worker
+            # writing frames into the same directory, overwriting and
+            # interleaving frames from different videos; give each file
+            # its own subdirectory instead
+            output_dir = output_dir / file_path.stem
         ensure_directory(output_dir)
 
     # Extract content
     try:
-        result = extract_content(
-            file_path=args.file,
+        return extract_content(
+            file_path=file_path,
             content_type=content_type,
             output_dir=output_dir,
             enable_frames=args.frames,
@@ -145,9 +167,11 @@ def main():
         )
     except Exception as e:
         print_status(f"Extraction failed: {e}", "error")
-        sys.exit(1)
+        return None
+
 
-    # Build output JSON
+def build_output(result) -> dict:
+    """Build the JSON-serializable output dict for one extraction."""
     output = {
         "file_name": result.metadata.file_name,
         "file_path": str(result.metadata.file_path),
@@ -189,15 +213,85 @@ def main():
     if result.image_paths:
         output["image_paths"] = [str(p) for p in result.image_paths]
 
-    # Output
-    json_output = json.dumps(output, indent=2, ensure_ascii=False)
+    return output
 
-    if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(json_output)
-        print_status(f"Saved to: {args.output}", "success")
+
+def write_output(output: dict, output_path) -> None:
+    """Write one output dict to a file, or stdout when no path is given.
+
+    Serializes straight to the destination stream so the full payload
+    (transcript segments can be tens of MB) is never also held as one
+    intermediate string.
+    """
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+        print_status(f"Saved to: {output_path}", "success")
     else:
-        print(json_output)
+        json.dump(output, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+
+
+def main():
+    """Main entry point."""
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    # Determine frame interval
+    if args.frame_interval is not None:
+        frame_interval = args.frame_interval
+    elif args.rapid:
+        frame_interval = RAPID_DEMO_FRAME_INTERVAL_SECONDS
+        print_status(f"Rapid demo mode: capturing frames every {frame_interval}s", "info")
+    else:
+        frame_interval = DEFAULT_FRAME_INTERVAL_SECONDS
+
+    if len(args.files) == 1:
+        result = extract_one(args.files[0], args, frame_interval)
+        if result is None:
+            sys.exit(1)
+        write_output(build_output(result), args.output)
+        return
+
+    # Batch mode: run the per-file pipelines concurrently. Extraction time
+    # is dominated by native code (whisper, OpenCV, PyMuPDF) that releases
+    # the GIL, so threads overlap the real work while sharing one loaded
+    # whisper model across files.
+    out_dir = None
+    if args.output:
+        out_dir = ensure_directory(args.output)
+
+    max_workers = args.max_workers or min(len(args.files), os.cpu_count() or 4, 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda file_path: extract_one(file_path, args, frame_interval),
+                args.files,
+            )
+        )
+
+    # Inputs from different directories can share a stem (a/x.mp4 b/x.mp4);
+    # number the later ones so they don't silently clobber the first
+    stem_counts = Counter(file_path.stem for file_path in args.files)
+    seen_stems: Counter = Counter()
+
+    failed = 0
+    for file_path, result in zip(args.files, results):
+        if result is None:
+            failed += 1
+            continue
+        output_path = None
+        if out_dir:
+            stem = file_path.stem
+            seen_stems[stem] += 1
+            if stem_counts[stem] > 1 and seen_stems[stem] > 1:
+                stem = f"{stem}-{seen_stems[stem]}"
+            output_path = out_dir / f"{stem}.json"
+        write_output(build_output(result), output_path)
+
+    if failed:
+        print_status(f"{failed} of {len(args.files)} files failed", "error")
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,8 @@ Markdown report generation for the Executive Review skill.
 Generates structured Markdown reports from analysis results.
 """
 
+import functools
+import io
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -21,6 +23,43 @@ from .utils import (
     format_file_size,
     get_content_type_display,
     print_status,
+    truncate_text,
+)
+
+
+# Severity markers used in report tables; built once instead of per row.
+_SEVERITY_LABELS = {
+    Severity.HIGH: "🔴 High",
+    Severity.MEDIUM: "🟡 Medium",
+    Severity.LOW: "🟢 Low",
+}
+
+_PRIORITY_ICONS = {
+    Severity.HIGH: "🔴",
+    Severity.MEDIUM: "🟡",
+    Severity.LOW: "🟢",
+}
+
+# Static scaffolding for the persona section, precomposed at import so each
+# rendered section only appends the dynamic rows.
+_CONCERNS_TABLE_HEADER = (
+    "### Key Concerns\n"
+    "\n"
+    "| Concern | Severity | Why It Matters |\n"
+    "|---------|----------|----------------|"
+)
+
+_FOLLOWUPS_HEADER = (
+    "### Potential Follow-ups\n"
+    "\n"
+    "After initial presentation, expect these follow-up requests:\n"
+)
+
+_RISKS_TABLE_HEADER = (
+    "### Risk Areas Identified\n"
+    "\n"
+    "| Risk | Impact | Mitigation |\n"
+    "|------|--------|------------|"
 )
 
 
@@ -39,12 +78,14 @@ def generate_header(
         Markdown string for header
     """
     metadata = content.metadata
+    # Fixed part of the header as one f-string; only the conditional
+    # metadata rows below need list appends
     lines = [
-        f"# Executive Review: {metadata.file_name}",
-        "",
-        f"**Reviewed**: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}",
-        f"**Content Type**: {get_content_type_display(metadata.content_type)}",
-        f"**File Size**: {format_file_size(metadata.file_size_bytes)}",
+        f"# Executive Review: {metadata.file_name}\n"
+        "\n"
+        f"**Reviewed**: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n"
+        f"**Content Type**: {get_content_type_display(metadata.content_type)}\n"
+        f"**File Size**: {format_file_size(metadata.file_size_bytes)}"
     ]
 
     # Add duration for video/audio
@@ -66,9 +107,7 @@ def generate_header(
         status = "Enabled" if enable_frame_analysis else "Disabled"
         lines.append(f"**Frame Analysis**: {status}")
 
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    lines.extend(("", "---", ""))
 
     return "\n".join(lines)
 
@@ -94,9 +133,9 @@ def generate_content_summary(
     if summary:
         lines.append(summary)
     else:
-        # Create a basic summary from the content
-        text_preview = content.text[:500] + "..." if len(content.text) > 500 else content.text
-        lines.append(f"*{text_preview}*")
+        # Create a basic summary from the content; truncate_text returns the
+        # original string untouched (no slice, no copy) when it fits
+        lines.append(f"*{truncate_text(content.text, max_length=500)}*")
 
     lines.append("")
 
@@ -122,8 +161,7 @@ def generate_content_summary(
             lines.append(f"- ... and {len(content.slides) - 5} more slides")
         lines.append("")
 
-    lines.append("---")
-    lines.append("")
+    lines.extend(("---", ""))
 
     return "\n".join(lines)
 
@@ -140,25 +178,17 @@ def generate_persona_section(analysis: AnalysisResult) -> str:
     """
     persona = analysis.persona
     lines = [
-        f"## Executive Analysis: {persona.title}",
-        "",
-        "### Persona Profile",
-        f"> {persona.perspective}",
-        "",
+        f"## Executive Analysis: {persona.title}\n"
+        "\n"
+        "### Persona Profile\n"
+        f"> {persona.perspective}\n"
     ]
 
     # Key Concerns Table
     if analysis.concerns:
-        lines.append("### Key Concerns")
-        lines.append("")
-        lines.append("| Concern | Severity | Why It Matters |")
-        lines.append("|---------|----------|----------------|")
+        lines.append(_CONCERNS_TABLE_HEADER)
         for concern in analysis.concerns:
-            severity_icon = {
-                Severity.HIGH: "🔴 High",
-                Severity.MEDIUM: "🟡 Medium",
-                Severity.LOW: "🟢 Low",
-            }.get(concern.severity, concern.severity.value)
+            severity_icon = _SEVERITY_LABELS.get(concern.severity, concern.severity.value)
             lines.append(f"| {concern.title} | {severity_icon} | {concern.why_it_matters} |")
         lines.append("")
 
@@ -167,39 +197,37 @@ def generate_persona_section(analysis: AnalysisResult) -> str:
         lines.append("### Questions They Would Ask")
         lines.append("")
 
-        # Group by category
-        categories = {}
-        for q in analysis.questions:
-            cat = q.category.value.title()
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(q)
+        # Use the category buckets built at analysis time; fall back to
+        # grouping here for results constructed without them
+        categories = analysis.questions_by_category
+        if not categories:
+            categories = {}
+            for q in analysis.questions:
+                categories.setdefault(q.category, []).append(q)
 
         for category, questions in categories.items():
-            lines.append(f"#### {category} Questions")
+            lines.append(f"#### {category.value.title()} Questions")
             lines.append("")
             for i, q in enumerate(questions, 1):
-                lines.append(f"{i}. **{q.text}**")
-                lines.append(f"   - *Why they'd ask*: {q.reasoning}")
-                lines.append(f"   - *Suggested response*: {q.suggested_response}")
-                lines.append("")
+                lines.extend(
+                    (
+                        f"{i}. **{q.text}**",
+                        f"   - *Why they'd ask*: {q.reasoning}",
+                        f"   - *Suggested response*: {q.suggested_response}",
+                        "",
+                    )
+                )
 
     # Follow-ups
     if analysis.followups:
-        lines.append("### Potential Follow-ups")
-        lines.append("")
-        lines.append("After initial presentation, expect these follow-up requests:")
-        lines.append("")
+        lines.append(_FOLLOWUPS_HEADER)
         for followup in analysis.followups:
             lines.append(f"- [ ] {followup}")
         lines.append("")
 
     # Risks Table
     if analysis.risks:
-        lines.append("### Risk Areas Identified")
-        lines.append("")
-        lines.append("| Risk | Impact | Mitigation |")
-        lines.append("|------|--------|------------|")
+        lines.append(_RISKS_TABLE_HEADER)
         for risk in analysis.risks:
             lines.append(f"| {risk.title} | {risk.impact} | {risk.mitigation} |")
         lines.append("")
@@ -209,20 +237,26 @@ def generate_persona_section(analysis: AnalysisResult) -> str:
         lines.append("### Recommendations for This Audience")
         lines.append("")
         for i, rec in enumerate(analysis.recommendations, 1):
-            priority_icon = {
-                Severity.HIGH: "🔴",
-                Severity.MEDIUM: "🟡",
-                Severity.LOW: "🟢",
-            }.get(rec.priority, "•")
+            priority_icon = _PRIORITY_ICONS.get(rec.priority, "•")
             lines.append(f"{i}. {priority_icon} {rec.text}")
         lines.append("")
 
-    lines.append("---")
-    lines.append("")
+    lines.extend(("---", ""))
 
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=4096)
+def _checklist_item(text: str, priority: Severity) -> ChecklistItem:
+    """Flyweight factory: identical checklist entries share one instance.
+
+    Several personas routinely produce the same recommendation text, and
+    ChecklistItem is frozen, so duplicates can safely collapse to a single
+    cached object instead of allocating one per occurrence.
+    """
+    return ChecklistItem.model_construct(text=text, priority=priority)
+
+
 def generate_checklist(analyses: list[AnalysisResult]) -> str:
     """
     Generate a consolidated preparation checklist from all analyses.
@@ -240,48 +274,77 @@ def generate_checklist(analyses: list[AnalysisResult]) -> str:
         "",
     ]
 
-    # Collect all recommendations by priority
+    # Collect all recommendations by priority in a single pass, routing each
+    # item through a severity-to-bucket table instead of an if/elif chain
     must_address = []
     should_prepare = []
     nice_to_have = []
+    buckets = {
+        Severity.HIGH: must_address,
+        Severity.MEDIUM: should_prepare,
+        Severity.LOW: nice_to_have,
+    }
 
     for analysis in analyses:
         for rec in analysis.recommendations:
-            item = f"{rec.text} ({analysis.persona.title})"
-            if rec.priority == Severity.HIGH:
-                must_address.append(item)
-            elif rec.priority == Severity.MEDIUM:
-                should_prepare.append(item)
-            else:
-                nice_to_have.append(item)
+            item = _checklist_item(f"{rec.text} ({analysis.persona.title})", rec.priority)
+            buckets.get(rec.priority, nice_to_have).append(item)
 
     if must_address:
         lines.append("### 🔴 Must Address")
         lines.append("")
         for item in must_address:
-            lines.append(f"- [ ] {item}")
+            lines.append(f"- [ ] {item.text}")
         lines.append("")
 
     if should_prepare:
         lines.append("### 🟡 Should Prepare")
         lines.append("")
         for item in should_prepare:
-            lines.append(f"- [ ] {item}")
+            lines.append(f"- [ ] {item.text}")
         lines.append("")
 
     if nice_to_have:
         lines.append("### 🟢 Nice to Have")
         lines.append("")
         for item in nice_to_have:
-            lines.append(f"- [ ] {item}")
+            lines.append(f"- [ ] {item.text}")
         lines.append("")
 
-    lines.append("---")
-    lines.append("")
+    lines.extend(("---", ""))
 
     return "\n".join(lines)
 
 
+def write_appendix(stream, content: ExtractionResult) -> None:
+    """
+    Write the appendix section with the full transcript/text to a stream.
+
+    Writing directly to the destination stream means the (potentially very
+    large) extracted text never has to be copied into the report string.
+
+    Args:
+        stream: Text stream to write the appendix to
+        content: Extracted content
+    """
+    stream.write("## Appendix\n\n")
+
+    if content.metadata.content_type in [ContentType.VIDEO, ContentType.AUDIO]:
+        stream.write("### Full Transcript\n\n")
+        stream.write("<details>\n<summary>Click to expand transcript</summary>\n\n")
+        stream.write("```\n")
+        stream.write(content.text)
+        stream.write("\n```\n\n</details>\n")
+    else:
+        stream.write("### Extracted Text\n\n")
+        stream.write("<details>\n<summary>Click to expand extracted text</summary>\n\n")
+        stream.write("```\n")
+        stream.write(content.text[:10000])  # Limit to 10k chars
+        if len(content.text) > 10000:
+            stream.write("\n... [truncated]")
+        stream.write("\n```\n\n</details>\n")
+
+
 def generate_appendix(content: ExtractionResult, include_full_text: bool = False) -> str:
     """
     Generate the appendix section with optional full transcript/text.
@@ -296,36 +359,9 @@ def generate_appendix(content: ExtractionResult, include_full_text: bool = False
     if not include_full_text:
         return ""
 
-    lines = ["## Appendix", ""]
-
-    if content.metadata.content_type in [ContentType.VIDEO, ContentType.AUDIO]:
-        lines.append("### Full Transcript")
-        lines.append("")
-        lines.append("<details>")
-        lines.append("<summary>Click to expand transcript</summary>")
-        lines.append("")
-        lines.append("```")
-        lines.append(content.text)
-        lines.append("```")
-        lines.append("")
-        lines.append("</details>")
-        lines.append("")
-    else:
-        lines.append("### Extracted Text")
-        lines.append("")
-        lines.append("<details>")
-        lines.append("<summary>Click to expand extracted text</summary>")
-        lines.append("")
-        lines.append("```")
-        lines.append(content.text[:10000])  # Limit to 10k chars
-        if len(content.text) > 10000:
-            lines.append("... [truncated]")
-        lines.append("```")
-        lines.append("")
-        lines.append("</details>")
-        lines.append("")
-
-    return "\n".join(lines)
+    buffer = io.StringIO()
+    write_appendix(buffer, content)
+    return buffer.getvalue()
 
 
 def generate_report(
@@ -352,35 +388,48 @@ def generate_report(
     """
     print_status("Generating report...", "progress")
 
-    sections = [
-        generate_header(content, enable_frame_analysis),
-        generate_content_summary(content, summary, key_topics),
-    ]
+    # Stream sections into one buffer instead of collecting them in a list
+    # and joining at the end; the appendix alone can be megabytes, so this
+    # avoids holding every section alongside the joined copy.
+    buffer = io.StringIO()
+    buffer.write(generate_header(content, enable_frame_analysis))
+    buffer.write("\n")
+    buffer.write(generate_content_summary(content, summary, key_topics))
 
     # Add persona sections
     for analysis in analyses:
-        sections.append(generate_persona_section(analysis))
+        buffer.write("\n")
+        buffer.write(generate_persona_section(analysis))
 
     # Add consolidated checklist
-    sections.append(generate_checklist(analyses))
+    buffer.write("\n")
+    buffer.write(generate_checklist(analyses))
 
     # Add appendix if requested
     if include_appendix:
-        sections.append(generate_appendix(content, include_full_text=True))
+        buffer.write("\n")
+        buffer.write(generate_appendix(content, include_full_text=True))
 
-    report = "\n".join(sections)
+    report = buffer.getvalue()
 
     print_status("Report generated successfully", "success")
     return report
 
 
-def save_report(report: str, output_path: Path) -> Path:
+def save_report(
+    report: str,
+    output_path: Path,
+    appendix_content: Optional[ExtractionResult] = None,
+) -> Path:
     """
     Save the report to a file.
 
     Args:
         report: Markdown report content
         output_path: Path to save the report
+        appendix_content: If given, stream the full-text appendix for this
+            content directly to the file after the report body, instead of
+            the caller embedding it in the report string
 
     Returns:
         Path to saved report
@@ -390,6 +439,9 @@ def save_report(report: str, output_path: Path) -> Path:
 
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(report)
+        if appendix_content is not None:
+            f.write("\n")
+            write_appendix(f, appendix_content)
 
     print_status(f"Report saved: {output_path}", "success")
     return output_path
@@ -17,20 +17,35 @@ Examples:
     python scripts/run.py slides.pptx --all-personas
 """
 
-import argparse
+import os.path
 import sys
+
+# Only bootstrap sys.path when invoked directly (python scripts/run.py);
+# when imported as part of the package or run via the console script, the
+# package is already importable and no path munging happens. For direct
+# invocation the script directory itself must also be dropped from the
+# path, because modules here (types.py) would otherwise shadow the stdlib
+# modules that argparse and friends import. Only sys/os are touched before
+# the cleanup since anything heavier already pulls in the shadowed names.
+if __package__ in (None, ""):
+    _SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+    sys.path[:] = [
+        p for p in sys.path if os.path.abspath(p or os.getcwd()) != _SCRIPT_DIR
+    ]
+    sys.path.insert(0, os.path.dirname(_SCRIPT_DIR))
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from scripts.analyze import analyze_content, get_persona
+from scripts.analyze import analyze_content, build_persona_suffix, get_persona
 from scripts.constants import (
     DEFAULT_FRAME_INTERVAL_SECONDS,
     DEFAULT_OUTPUT_DIR,
     EXECUTIVE_PERSONAS,
+    EXTRACTION_CACHE_DIRNAME,
     RAPID_DEMO_FRAME_INTERVAL_SECONDS,
     REPORT_FILENAME_TEMPLATE,
     USER_TYPE_PERSONA_DEFAULTS,
@@ -52,30 +67,50 @@ from scripts.utils import (
 )
 
 
+# CLI aliases accepted for personas and user types; built once at import
+# instead of inside the parse functions (parse_personas rebuilt its map once
+# per comma-separated entry).
+_PERSONA_ALIASES: dict[str, PersonaType] = {
+    "ceo": PersonaType.CEO,
+    "cfo": PersonaType.CFO,
+    "cto": PersonaType.CTO,
+    "vp_product": PersonaType.VP_PRODUCT,
+    "vpproduct": PersonaType.VP_PRODUCT,
+    "vp-product": PersonaType.VP_PRODUCT,
+    "product": PersonaType.VP_PRODUCT,
+    "ciso": PersonaType.CISO,
+    "security": PersonaType.CISO,
+    "vp_operations": PersonaType.VP_OPERATIONS,
+    "vpoperations": PersonaType.VP_OPERATIONS,
+    "vp-operations": PersonaType.VP_OPERATIONS,
+    "operations": PersonaType.VP_OPERATIONS,
+    "ops": PersonaType.VP_OPERATIONS,
+}
+
+_USER_TYPE_ALIASES: dict[str, UserType] = {
+    "sales": UserType.SALES_ENGINEER,
+    "sales_engineer": UserType.SALES_ENGINEER,
+    "product": UserType.PRODUCT_MANAGER,
+    "product_manager": UserType.PRODUCT_MANAGER,
+    "pm": UserType.PRODUCT_MANAGER,
+    "developer": UserType.DEVELOPER,
+    "dev": UserType.DEVELOPER,
+    "writer": UserType.TECHNICAL_WRITER,
+    "technical_writer": UserType.TECHNICAL_WRITER,
+    "marketing": UserType.MARKETING,
+    "solutions": UserType.SOLUTIONS_ARCHITECT,
+    "solutions_architect": UserType.SOLUTIONS_ARCHITECT,
+    "sa": UserType.SOLUTIONS_ARCHITECT,
+}
+
+
 def parse_personas(persona_str: str) -> list[PersonaType]:
     """Parse comma-separated persona string into list of PersonaType."""
     personas = []
     for p in persona_str.lower().split(","):
         p = p.strip()
-        # Handle various input formats
-        persona_map = {
-            "ceo": PersonaType.CEO,
-            "cfo": PersonaType.CFO,
-            "cto": PersonaType.CTO,
-            "vp_product": PersonaType.VP_PRODUCT,
-            "vpproduct": PersonaType.VP_PRODUCT,
-            "vp-product": PersonaType.VP_PRODUCT,
-            "product": PersonaType.VP_PRODUCT,
-            "ciso": PersonaType.CISO,
-            "security": PersonaType.CISO,
-            "vp_operations": PersonaType.VP_OPERATIONS,
-            "vpoperations": PersonaType.VP_OPERATIONS,
-            "vp-operations": PersonaType.VP_OPERATIONS,
-            "operations": PersonaType.VP_OPERATIONS,
-            "ops": PersonaType.VP_OPERATIONS,
-        }
-        if p in persona_map:
-            personas.append(persona_map[p])
+        if p in _PERSONA_ALIASES:
+            personas.append(_PERSONA_ALIASES[p])
         else:
             print_status(f"Unknown persona: {p}", "warning")
 
@@ -84,22 +119,7 @@ def parse_personas(persona_str: str) -> list[PersonaType]:
 
 def parse_user_type(user_type_str: str) -> Optional[UserType]:
     """Parse user type string into UserType enum."""
-    user_type_map = {
-        "sales": UserType.SALES_ENGINEER,
-        "sales_engineer": UserType.SALES_ENGINEER,
-        "product": UserType.PRODUCT_MANAGER,
-        "product_manager": UserType.PRODUCT_MANAGER,
-        "pm": UserType.PRODUCT_MANAGER,
-        "developer": UserType.DEVELOPER,
-        "dev": UserType.DEVELOPER,
-        "writer": UserType.TECHNICAL_WRITER,
-        "technical_writer": UserType.TECHNICAL_WRITER,
-        "marketing": UserType.MARKETING,
-        "solutions": UserType.SOLUTIONS_ARCHITECT,
-        "solutions_architect": UserType.SOLUTIONS_ARCHITECT,
-        "sa": UserType.SOLUTIONS_ARCHITECT,
-    }
-    return user_type_map.get(user_type_str.lower().strip())
+    return _USER_TYPE_ALIASES.get(user_type_str.lower().strip())
 
 
 def create_argument_parser() -> argparse.ArgumentParser:
@@ -196,6 +216,11 @@ Available personas:
         action="store_true",
         help="Exclude full transcript/text from report",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract content even if a cached extraction exists",
+    )
 
     # Other options
     parser.add_argument(
@@ -238,7 +263,9 @@ def run_review(
     whisper_model: str = WHISPER_DEFAULT_MODEL,
     output_path: Optional[Path] = None,
     include_appendix: bool = True,
+    use_cache: bool = True,
     verbose: bool = False,
+    content_type: Optional[ContentType] = None,
 ) -> Path:
     """
     Run the complete executive review workflow.
@@ -251,7 +278,10 @@ def run_review(
         whisper_model: Whisper model for transcription
         output_path: Optional output file path
         include_appendix: Whether to include appendix
+        use_cache: Whether to reuse cached extractions of unmodified files
         verbose: Enable verbose output
+        content_type: Pre-detected content type; detected from the file
+            extension when not supplied
 
     Returns:
         Path to generated report
@@ -266,7 +296,8 @@ def run_review(
         print_status(message, "error")
         sys.exit(1)
 
-    content_type = detect_content_type(file_path)
+    if content_type is None:
+        content_type = detect_content_type(file_path)
     if not content_type:
         print_status(f"Could not detect content type for: {file_path}", "error")
         sys.exit(1)
@@ -285,17 +316,35 @@ def run_review(
 
     ensure_directory(output_dir)
 
-    # Step 3: Extract content
+    # Keep the extraction cache next to where output is going: under the
+    # default output root normally, or beside an explicit --output report,
+    # so no stray output/ tree appears in the working directory.
+    cache_dir = None
+    if use_cache:
+        cache_root = output_path.parent if output_path else Path(DEFAULT_OUTPUT_DIR)
+        cache_dir = cache_root / EXTRACTION_CACHE_DIRNAME
+
+    # Step 3: Extract content, overlapping persona prompt preparation.
+    # Persona suffixes depend only on the persona definitions, so warm their
+    # cache in the background while extraction (the long pole) runs.
     print_status("Step 2: Extracting content...", "progress")
 
-    content = extract_content(
-        file_path=file_path,
-        content_type=content_type,
-        output_dir=output_dir,
-        enable_frames=enable_frames,
-        whisper_model=whisper_model,
-        frame_interval=frame_interval,
-    )
+    with ThreadPoolExecutor(max_workers=1) as prep_executor:
+        prep_future = prep_executor.submit(
+            lambda: [build_persona_suffix(get_persona(p)) for p in personas]
+        )
+
+        content = extract_content(
+            file_path=file_path,
+            content_type=content_type,
+            output_dir=output_dir,
+            enable_frames=enable_frames,
+            whisper_model=whisper_model,
+            frame_interval=frame_interval,
+            cache_dir=cache_dir,
+        )
+
+        prep_future.result()
 
     if verbose:
         print_status(f"Extracted {len(content.text)} characters of text", "info")
@@ -310,15 +359,17 @@ def run_review(
     # Step 5: Generate report
     print_status("Step 4: Generating report...", "progress")
 
+    # The appendix is streamed straight to disk by save_report rather than
+    # embedded in the in-memory report string.
     report = generate_report(
         content=content,
         analyses=analyses,
         enable_frame_analysis=enable_frames,
-        include_appendix=include_appendix,
+        include_appendix=False,
     )
 
     # Step 6: Save report
-    save_report(report, report_path)
+    save_report(report, report_path, appendix_content=content if include_appendix else None)
 
     print_header("Review Complete")
     print_status(f"Report saved: {report_path}", "success")
@@ -400,7 +451,9 @@ def main():
             whisper_model=args.whisper_model,
             output_path=args.output,
             include_appendix=not args.no_appendix,
+            use_cache=not args.no_cache,
             verbose=args.verbose,
+            content_type=content_type,
         )
     except KeyboardInterrupt:
         print_status("\nReview cancelled by user", "warning")
@@ -9,7 +9,7 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ContentType(str, Enum):
@@ -63,6 +63,14 @@ class Severity(str, Enum):
     MEDIUM = "medium"
     LOW = "low"
 
+    @property
+    def rank(self) -> int:
+        """Sort rank, highest severity first."""
+        return _SEVERITY_RANKS[self]
+
+
+_SEVERITY_RANKS = {Severity.HIGH: 0, Severity.MEDIUM: 1, Severity.LOW: 2}
+
 
 # ============================================================================
 # Extraction Models
@@ -70,11 +78,16 @@ class Severity(str, Enum):
 
 
 class TimestampedSegment(BaseModel):
-    """A segment of transcript with timing information."""
+    """A segment of transcript with timing information.
 
-    start: float = Field(description="Start time in seconds")
-    end: float = Field(description="End time in seconds")
-    text: str = Field(description="Transcribed text")
+    Bare annotations on purpose: one instance exists per transcript
+    segment, and description-only FieldInfo is schema metadata the
+    validator would otherwise carry for thousands of constructions.
+    """
+
+    start: float  # seconds
+    end: float  # seconds
+    text: str
 
 
 class SlideContent(BaseModel):
@@ -112,8 +125,8 @@ class ExtractionResult(BaseModel):
     slides: Optional[list[SlideContent]] = Field(
         default=None, description="Slide content for presentations"
     )
-    image_paths: list[Path] = Field(
-        default_factory=list, description="Paths to extracted images/frames"
+    image_paths: tuple[Path, ...] = Field(
+        default=(), description="Paths to extracted images/frames"
     )
 
 
@@ -128,9 +141,9 @@ class ExecutivePersona(BaseModel):
     type: PersonaType
     name: str = Field(description="Display name, e.g., 'Chief Executive Officer'")
     title: str = Field(description="Short title, e.g., 'CEO'")
-    focus_areas: list[str] = Field(description="Areas this persona focuses on")
+    focus_areas: tuple[str, ...] = Field(description="Areas this persona focuses on")
     question_style: str = Field(description="How this persona asks questions")
-    key_concerns: list[str] = Field(description="Primary concerns")
+    key_concerns: tuple[str, ...] = Field(description="Primary concerns")
     perspective: str = Field(description="How they view content")
 
 
@@ -142,15 +155,19 @@ class ExecutivePersona(BaseModel):
 class Question(BaseModel):
     """A question an executive would ask."""
 
-    text: str = Field(description="The question itself")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    text: str  # the question itself
     category: QuestionCategory
-    reasoning: str = Field(description="Why they would ask this")
-    suggested_response: str = Field(description="How to prepare for this question")
+    reasoning: str  # why they would ask this
+    suggested_response: str  # how to prepare for this question
 
 
 class Concern(BaseModel):
     """A concern identified by the executive persona."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str
     description: str
     severity: Severity
@@ -160,6 +177,8 @@ class Concern(BaseModel):
 class Risk(BaseModel):
     """A risk identified in the content."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str
     impact: str
     mitigation: str
@@ -168,6 +187,8 @@ class Risk(BaseModel):
 class Recommendation(BaseModel):
     """A recommendation for the presenter."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str
     priority: Severity
 
@@ -175,12 +196,20 @@ class Recommendation(BaseModel):
 class AnalysisResult(BaseModel):
     """Analysis result for a single persona."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     persona: ExecutivePersona
-    questions: list[Question] = Field(default_factory=list)
-    concerns: list[Concern] = Field(default_factory=list)
-    followups: list[str] = Field(default_factory=list, description="Expected follow-up requests")
-    risks: list[Risk] = Field(default_factory=list)
-    recommendations: list[Recommendation] = Field(default_factory=list)
+    # Tuples rather than lists: the payloads are built once, then only read
+    # by the report renderer, and the empty default () is a shared singleton
+    questions: tuple[Question, ...] = ()
+    questions_by_category: dict[QuestionCategory, list[Question]] = Field(
+        default_factory=dict,
+        description="Questions grouped by category, bucketed at analysis time",
+    )
+    concerns: tuple[Concern, ...] = ()
+    followups: tuple[str, ...] = Field(default=(), description="Expected follow-up requests")
+    risks: tuple[Risk, ...] = ()
+    recommendations: tuple[Recommendation, ...] = ()
 
 
 # ============================================================================
@@ -191,12 +220,14 @@ class AnalysisResult(BaseModel):
 class UserPreferences(BaseModel):
     """User preferences for the review."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     personas: list[PersonaType] = Field(description="Selected executive personas")
     enable_frame_analysis: bool = Field(
         default=False, description="Whether to analyze video frames"
     )
-    focus_areas: list[str] = Field(
-        default_factory=list, description="Specific areas to focus on"
+    focus_areas: tuple[str, ...] = Field(
+        default=(), description="Specific areas to focus on"
     )
     user_type: Optional[UserType] = Field(
         default=None, description="Type of user for tailored output"
@@ -214,6 +245,8 @@ class UserPreferences(BaseModel):
 class ChecklistItem(BaseModel):
     """An item in the preparation checklist."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     text: str
     priority: Severity
 
@@ -221,16 +254,18 @@ class ChecklistItem(BaseModel):
 class ReviewReport(BaseModel):
     """Complete review report."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     title: str
     generated_at: datetime = Field(default_factory=datetime.now)
     content_summary: str
     content_type: ContentType
     metadata: ExtractionMetadata
-    key_topics: list[str]
-    visual_elements: list[str] = Field(
-        default_factory=list, description="Notable visual elements"
+    key_topics: tuple[str, ...]
+    visual_elements: tuple[str, ...] = Field(
+        default=(), description="Notable visual elements"
     )
-    persona_analyses: list[AnalysisResult]
-    must_address: list[ChecklistItem] = Field(default_factory=list)
-    should_prepare: list[ChecklistItem] = Field(default_factory=list)
-    nice_to_have: list[ChecklistItem] = Field(default_factory=list)
+    persona_analyses: tuple[AnalysisResult, ...]
+    must_address: tuple[ChecklistItem, ...] = ()
+    should_prepare: tuple[ChecklistItem, ...] = ()
+    nice_to_have: tuple[ChecklistItem, ...] = ()